@@ -1,16 +1,15 @@
 import logging
+import os
+from typing import Any
+from uuid import UUID
 
-from bluenumbers.bluetooth_sig_loader import (
-    ad_types,
-    company_identifiers,
-    full_uuids,
-    update,
-    uuids,
-)
+from bluenumbers import bluetooth_sig_loader
+from bluenumbers.bluetooth_sig_loader import update
 from bluenumbers.models import AdTypeInfo, AssignedUUID, CompanyIdentifier
 from bluenumbers.parser import (
     AdPacket,
     AdStruct,
+    AdStructModel,
     AdType,
     DecodedAdValue,
     Flags,
@@ -25,7 +24,7 @@ from bluenumbers.parser import (
     get_full_uuid,
 )
 
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 
 def _check_repo_init():
@@ -33,18 +32,34 @@ def _check_repo_init():
 
     repo_dir = get_repo_dir()
     if not repo_dir.exists():
-        logging.info("Bluetooth SIG repository not found. Initializing on first import...")
+        logger.info("Bluetooth SIG repository not found. Initializing on first import...")
         try:
             ensure_repo_exists()
-            logging.info("Bluetooth SIG repository initialized successfully.")
+            logger.info("Bluetooth SIG repository initialized successfully.")
         except Exception as e:
-            logging.warning(f"Failed to initialize Bluetooth SIG repository: {e}")
-            logging.warning(
+            logger.warning(f"Failed to initialize Bluetooth SIG repository: {e}")
+            logger.warning(
                 "Some functions may not work correctly. Run bluenumbers.bluetooth_sig_loader.ensure_repo_exists() manually."
             )
 
 
-_check_repo_init()
+# Otherwise the repository is cloned on first access to an assigned number table
+if os.environ.get("BLUENUMBERS_AUTO_SYNC") == "1":
+    _check_repo_init()
+
+
+# The tables below are loaded on first access through the module __getattr__
+ad_types: dict[int, AdTypeInfo]
+company_identifiers: dict[int, CompanyIdentifier]
+uuids: dict[int, AssignedUUID]
+full_uuids: dict[UUID, AssignedUUID]
+
+
+def __getattr__(name: str) -> Any:
+    # Assigned number tables are loaded lazily, and reloaded after update()
+    if name in ("ad_types", "company_identifiers", "uuids", "full_uuids"):
+        return getattr(bluetooth_sig_loader, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
@@ -57,6 +72,7 @@ __all__ = [
     "AdTypeInfo",
     "update",
     "AdStruct",
+    "AdStructModel",
     "AdPacket",
     "AdType",
     "Flags",
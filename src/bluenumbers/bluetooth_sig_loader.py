@@ -1,23 +1,45 @@
+import hashlib
 import logging
+import os
+import pickle
 import subprocess
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Final
 from uuid import UUID
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 from bluenumbers.models import AdTypeInfo, AssignedUUID, CompanyIdentifier
 
+logger = logging.getLogger(__name__)
+
 REPO_URL: Final[str] = "https://bitbucket.org/bluetooth-SIG/public.git"
 
+YAML_CACHE_SUFFIX: Final[str] = ".pkl"
+
 BLUETOOTH_SIG_UUID_BASE: Final[UUID] = UUID("00000000-0000-1000-8000-00805F9B34FB")
 
+_BLUETOOTH_SIG_UUID_BASE_INT: Final[int] = BLUETOOTH_SIG_UUID_BASE.int
+
 
 def get_full_uuid(short_uuid: int) -> UUID:
     """Get the full 128-bit UUID from a 16-bit UUID."""
-    base_bytes = BLUETOOTH_SIG_UUID_BASE.bytes
-    short_bytes = short_uuid.to_bytes(2, "little")
-    return UUID(bytes=base_bytes[:12] + short_bytes + base_bytes[14:])
+    return UUID(int=_BLUETOOTH_SIG_UUID_BASE_INT | (short_uuid << 96))
+
+
+def get_cache_dir() -> Path:
+    """Get the directory holding parsed copies of the YAML files, outside the repository."""
+    if cache_dir := os.environ.get("BLUENUMBERS_CACHE_DIR"):
+        return Path(cache_dir)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "bluenumbers"
 
 
 # Change to use a directory within the package's resources
@@ -40,20 +62,24 @@ def ensure_repo_exists() -> str:
 
     if repo_dir.exists():
         # Repository already exists, do nothing
-        logging.debug(f"Repository already exists at {repo_dir}")
+        logger.debug(f"Repository already exists at {repo_dir}")
     else:
         # Ensure parent directory exists
         repo_dir.parent.mkdir(parents=True, exist_ok=True)
         subprocess.run(["git", "clone", "--depth", "1", REPO_URL, repo_dir], check=True)
-        logging.info(f"Cloned repository to {repo_dir}")
+        logger.info(f"Cloned repository to {repo_dir}")
+
+    return _get_head_commit(repo_dir)
 
-    commit_hash = subprocess.run(
+
+def _get_head_commit(repo_dir: Path) -> str:
+    """Get the commit hash checked out in the repository."""
+    return subprocess.run(
         ["git", "-C", repo_dir, "rev-parse", "HEAD"],
         capture_output=True,
         text=True,
         check=True,
     ).stdout.strip()
-    return commit_hash
 
 
 def update() -> bool:
@@ -65,41 +91,72 @@ def update() -> bool:
         ensure_repo_exists()
         return True
 
-    # Get the current commit hash before pulling
-    before_hash = subprocess.run(
-        ["git", "-C", repo_dir, "rev-parse", "HEAD"],
+    # Compare the remote HEAD with the local one before transferring anything
+    before_hash = _get_head_commit(repo_dir)
+    remote_hash = subprocess.run(
+        ["git", "-C", repo_dir, "ls-remote", "origin", "HEAD"],
         capture_output=True,
         text=True,
         check=True,
-    ).stdout.strip()
-
-    # Pull the latest changes
-    subprocess.run(["git", "-C", repo_dir, "pull"], check=True)
+    ).stdout.partition("\t")[0]
+    if remote_hash == before_hash:
+        logger.debug(f"Repository already up-to-date in {repo_dir}")
+        return False
 
-    # Get the commit hash after pulling
-    after_hash = subprocess.run(
-        ["git", "-C", repo_dir, "rev-parse", "HEAD"],
-        capture_output=True,
-        text=True,
-        check=True,
-    ).stdout.strip()
+    # Fetch only the latest commit and move the shallow clone onto it
+    subprocess.run(["git", "-C", repo_dir, "fetch", "--depth", "1", "origin", "HEAD"], check=True)
+    subprocess.run(["git", "-C", repo_dir, "reset", "--hard", "FETCH_HEAD"], check=True)
 
     # Compare hashes to determine if there was an update
-    updated = before_hash != after_hash
+    updated = before_hash != _get_head_commit(repo_dir)
 
     if updated:
-        global ad_types, company_identifiers, uuids, full_uuids
-        ad_types = get_ad_types()
-        company_identifiers = get_company_identifiers()
-        uuids = get_uuids()
-        full_uuids = {uuid["full_uuid"]: uuid for uuid in uuids.values()}
-        logging.info(f"Repository updated in {repo_dir}")
+        # Reload the tables from the new data on next access
+        _tables.clear()
+        logger.info(f"Repository updated in {repo_dir}")
     else:
-        logging.debug(f"Repository already up-to-date in {repo_dir}")
+        logger.debug(f"Repository already up-to-date in {repo_dir}")
 
     return updated
 
 
+def _load_yaml_cached(path: Path) -> Any:
+    """Load a YAML file, reusing a pickled copy of the parsed data if the file is unchanged.
+
+    The cache is stored in get_cache_dir() and starts with a hash of the YAML content,
+    so an update that changes the file invalidates it automatically.
+    """
+    data = path.read_bytes()
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    cache_file = get_cache_dir() / (path.name + YAML_CACHE_SUFFIX)
+
+    try:
+        cached = cache_file.read_bytes()
+    except OSError:
+        cached = b""
+    if cached[: len(digest)] == digest:
+        try:
+            # Unpickle from a view so the payload is not copied out of the file buffer
+            return pickle.loads(memoryview(cached)[len(digest) :])
+        except Exception as e:
+            # Any broken cache is ignored and rewritten below
+            logger.debug(f"Ignoring unreadable YAML cache {cache_file}: {e}")
+
+    result = yaml.load(data, Loader=SafeLoader)
+
+    # Write atomically so a concurrent import never sees a half-written cache
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_bytes(digest + pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.debug(f"Failed to write YAML cache {cache_file}: {e}")
+        tmp_file.unlink(missing_ok=True)
+
+    return result
+
+
 def get_company_identifiers() -> dict[int, CompanyIdentifier]:
     """Get company identifiers directly from the cloned repository."""
     repo_dir = get_repo_dir()
@@ -109,10 +166,11 @@ def get_company_identifiers() -> dict[int, CompanyIdentifier]:
     if not company_identifier_file.exists():
         ensure_repo_exists()
 
-    company_identifier_list: list[dict[str, Any]] = yaml.safe_load(
-        company_identifier_file.read_text()
-    )["company_identifiers"]
-    return {ci["value"]: CompanyIdentifier(**ci) for ci in company_identifier_list}
+    # The parsed entries already have the CompanyIdentifier shape, so index them without copying
+    company_identifier_list: list[CompanyIdentifier] = _load_yaml_cached(company_identifier_file)[
+        "company_identifiers"
+    ]
+    return {ci["value"]: ci for ci in company_identifier_list}
 
 
 def get_uuids() -> dict[int, AssignedUUID]:
@@ -123,8 +181,13 @@ def get_uuids() -> dict[int, AssignedUUID]:
     if not uuid_dir.exists():
         ensure_repo_exists()
 
-    for uuid_file in uuid_dir.glob("*.yaml"):
-        uuid_list = yaml.safe_load(uuid_file.read_text())["uuids"]
+    # Read and parse the files concurrently, then merge them in glob order
+    uuid_files = list(uuid_dir.glob("*.yaml"))
+    with ThreadPoolExecutor() as executor:
+        documents = list(executor.map(_load_yaml_cached, uuid_files))
+
+    for uuid_file, document in zip(uuid_files, documents):
+        uuid_list = document["uuids"]
         result |= {
             uuid["uuid"]: AssignedUUID(
                 short_uuid=uuid["uuid"],
@@ -145,11 +208,39 @@ def get_ad_types() -> dict[int, AdTypeInfo]:
     if not ad_types_file.exists():
         ensure_repo_exists()
 
-    ad_type_list = yaml.safe_load(ad_types_file.read_text())["ad_types"]
-    return {t["value"]: AdTypeInfo(**t) for t in ad_type_list}
+    ad_type_list: list[AdTypeInfo] = _load_yaml_cached(ad_types_file)["ad_types"]
+    return {t["value"]: t for t in ad_type_list}
+
+
+def get_full_uuids() -> dict[UUID, AssignedUUID]:
+    """Get the loaded UUIDs keyed by their full 128-bit UUID."""
+    return {uuid["full_uuid"]: uuid for uuid in _get_table("uuids").values()}
+
+
+# The tables below are loaded on first access through the module __getattr__
+ad_types: dict[int, AdTypeInfo]
+company_identifiers: dict[int, CompanyIdentifier]
+uuids: dict[int, AssignedUUID]
+full_uuids: dict[UUID, AssignedUUID]
+
+_TABLE_LOADERS: Final[dict[str, Callable[[], dict[Any, Any]]]] = {
+    "ad_types": get_ad_types,
+    "company_identifiers": get_company_identifiers,
+    "uuids": get_uuids,
+    "full_uuids": get_full_uuids,
+}
+
+_tables: dict[str, dict[Any, Any]] = {}
+
+
+def _get_table(name: str) -> dict[Any, Any]:
+    """Get an assigned number table, loading it on first access."""
+    if name not in _tables:
+        _tables[name] = _TABLE_LOADERS[name]()
+    return _tables[name]
 
 
-ad_types: dict[int, AdTypeInfo] = get_ad_types()
-company_identifiers: dict[int, CompanyIdentifier] = get_company_identifiers()
-uuids: dict[int, AssignedUUID] = get_uuids()
-full_uuids: dict[UUID, AssignedUUID] = {uuid["full_uuid"]: uuid for uuid in get_uuids().values()}
+def __getattr__(name: str) -> Any:
+    if name not in _TABLE_LOADERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _get_table(name)
@@ -1,10 +1,20 @@
 import base64
-from collections.abc import Iterator
+import struct
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 from enum import IntEnum, IntFlag
-from typing import Literal, cast
-from uuid import UUID
-
-from pydantic import BaseModel, ValidationError, computed_field, field_serializer, field_validator
+from functools import cached_property, lru_cache, partial
+from typing import Annotated, Any, ClassVar, Final, Literal, Self, cast
+from uuid import UUID, SafeUUID
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    GetPydanticSchema,
+    computed_field,
+    field_serializer,
+)
+from pydantic_core import core_schema
 
 import bluenumbers
 
@@ -63,6 +73,60 @@ class AdType(IntEnum):
     MANUFACTURER_SPECIFIC_DATA = 0xFF
 
 
+# AdType members and their names by value, avoiding EnumMeta.__call__ on lookups
+_AD_TYPES: Final[dict[int, AdType]] = {ad_type.value: ad_type for ad_type in AdType}
+_AD_TYPE_NAMES: Final[dict[int, str]] = {ad_type.value: ad_type.name for ad_type in AdType}
+
+# Bluetooth Base UUID 00000000-0000-1000-8000-00805F9B34FB as an integer
+_BASE_UUID_INT: Final[int] = 0x0000000000001000800000805F9B34FB
+
+_UUID_LIST_AD_TYPES: Final[tuple[AdType, ...]] = (
+    AdType.INCOMPLETE_LIST_OF_16_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS,
+    AdType.COMPLETE_LIST_OF_16_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS,
+    AdType.INCOMPLETE_LIST_OF_32_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS,
+    AdType.COMPLETE_LIST_OF_32_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS,
+    AdType.INCOMPLETE_LIST_OF_128_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS,
+    AdType.COMPLETE_LIST_OF_128_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS,
+    AdType.LIST_OF_16_BIT_SERVICE_SOLICITATION_UUIDS,
+    AdType.LIST_OF_32_BIT_SERVICE_SOLICITATION_UUIDS,
+    AdType.LIST_OF_128_BIT_SERVICE_SOLICITATION_UUIDS,
+)
+
+_SERVICE_DATA_AD_TYPES: Final[tuple[AdType, ...]] = (
+    AdType.SERVICE_DATA_16_BIT_UUID,
+    AdType.SERVICE_DATA_32_BIT_UUID,
+    AdType.SERVICE_DATA_128_BIT_UUID,
+)
+
+# AD structure header: length octet followed by the AD type octet
+_AD_HEADER: Final[struct.Struct] = struct.Struct("<BB")
+
+# Little-endian UUID layouts; a 128-bit UUID is read as its low and high 64-bit halves
+_UINT16: Final[struct.Struct] = struct.Struct("<H")
+_UINT32: Final[struct.Struct] = struct.Struct("<I")
+_UINT128: Final[struct.Struct] = struct.Struct("<QQ")
+
+# UUID bit length of each UUID-carrying AD type, indexed by AD type value (0 for other types)
+_uuid_bit_lengths = bytearray(256)
+for _ad_type, _bits in (
+    (AdType.INCOMPLETE_LIST_OF_16_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS, 16),
+    (AdType.COMPLETE_LIST_OF_16_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS, 16),
+    (AdType.INCOMPLETE_LIST_OF_32_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS, 32),
+    (AdType.COMPLETE_LIST_OF_32_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS, 32),
+    (AdType.INCOMPLETE_LIST_OF_128_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS, 128),
+    (AdType.COMPLETE_LIST_OF_128_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS, 128),
+    (AdType.LIST_OF_16_BIT_SERVICE_SOLICITATION_UUIDS, 16),
+    (AdType.LIST_OF_32_BIT_SERVICE_SOLICITATION_UUIDS, 32),
+    (AdType.LIST_OF_128_BIT_SERVICE_SOLICITATION_UUIDS, 128),
+    (AdType.SERVICE_DATA_16_BIT_UUID, 16),
+    (AdType.SERVICE_DATA_32_BIT_UUID, 32),
+    (AdType.SERVICE_DATA_128_BIT_UUID, 128),
+):
+    _uuid_bit_lengths[_ad_type] = _bits
+_UUID_BIT_LENGTHS: Final[bytes] = bytes(_uuid_bit_lengths)
+del _uuid_bit_lengths, _ad_type, _bits
+
+
 class Flags(IntFlag):
     LE_LIMITED_DISCOVERABLE_MODE = 0b00000001
     LE_GENERAL_DISCOVERABLE_MODE = 0b00000010
@@ -71,6 +135,20 @@ class Flags(IntFlag):
     SIMULTANEOUS_LE_AND_BR_EDR_TO_SAME_DEVICE_CAPABLE_HOST = 0b00010000
 
 
+def _uuid_from_int(value: int) -> UUID:
+    # UUID(int=...) range-checks and dispatches over its other arguments; only for values
+    # already known to be in range, such as those decoded from at most 16 bytes
+    uuid = object.__new__(UUID)
+    object.__setattr__(uuid, "int", value)
+    object.__setattr__(uuid, "is_safe", SafeUUID.unknown)
+    return uuid
+
+
+@lru_cache(maxsize=65536)
+def _get_full_uuid_from_short(short_uuid: int) -> UUID:
+    return _uuid_from_int(_BASE_UUID_INT | (short_uuid << 96))
+
+
 def get_full_uuid(short_uuid: int, bit_length: int) -> UUID:
     """
     >>> get_full_uuid(0xaaaa, 16)
@@ -78,20 +156,25 @@ def get_full_uuid(short_uuid: int, bit_length: int) -> UUID:
     >>> get_full_uuid(0xaaaaaaaa, 32)
     UUID('aaaaaaaa-0000-1000-8000-00805f9b34fb')
     """
-    base_uuid = "00000000-0000-1000-8000-00805F9B34FB"
     match bit_length:
-        case 16:
-            return UUID(f"{base_uuid[:4]}{short_uuid:04X}-{base_uuid[9:]}")
-        case 32:
-            return UUID(f"{short_uuid:08X}-{base_uuid[8:]}")
+        case 16 | 32:
+            # _get_full_uuid_from_short skips UUID's own range checks, so check here
+            if not 0 <= short_uuid < 1 << bit_length:
+                raise ValueError(f"UUID {short_uuid:#x} does not fit in {bit_length} bits.")
+            return _get_full_uuid_from_short(short_uuid)
         case 128:
             return UUID(int=short_uuid)
         case _:
             raise ValueError("Invalid bit length. Must be 16, 32, or 128.")
 
 
+# Every possible Flags octet, built once instead of through IntFlag lookup per packet
+_FLAGS_BY_OCTET: Final[tuple[Flags, ...]] = tuple(Flags(octet) for octet in range(256))
+
+
 def decode_flags(value: bytes) -> Flags:
-    return Flags(int.from_bytes(value, "little"))
+    # Only the first octet of the Flags data type is defined
+    return _FLAGS_BY_OCTET[value[0] if value else 0]
 
 
 def decode_uuid_list(
@@ -107,38 +190,67 @@ def decode_uuid_list(
         AdType.LIST_OF_128_BIT_SERVICE_SOLICITATION_UUIDS,
     ],
     value: bytes,
-) -> list[str]:
-    uuids = []
-    uuid_length = {
-        AdType.INCOMPLETE_LIST_OF_16_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS: 16,
-        AdType.COMPLETE_LIST_OF_16_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS: 16,
-        AdType.INCOMPLETE_LIST_OF_32_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS: 32,
-        AdType.COMPLETE_LIST_OF_32_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS: 32,
-        AdType.INCOMPLETE_LIST_OF_128_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS: 128,
-        AdType.COMPLETE_LIST_OF_128_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS: 128,
-        AdType.LIST_OF_16_BIT_SERVICE_SOLICITATION_UUIDS: 16,
-        AdType.LIST_OF_32_BIT_SERVICE_SOLICITATION_UUIDS: 32,
-        AdType.LIST_OF_128_BIT_SERVICE_SOLICITATION_UUIDS: 128,
-    }[ad_type]
-    for i in range(0, len(value), uuid_length // 8):
-        uuid = int.from_bytes(value[i : i + uuid_length // 8], "little")
-        uuids.append(str(get_full_uuid(uuid, uuid_length)))
-    return uuids
+) -> list[UUID]:
+    uuid_length = _UUID_BIT_LENGTHS[ad_type]
+    if not uuid_length:
+        raise ValueError(f"AD type {ad_type:#04x} does not carry UUIDs.")
+    uuid_size = uuid_length // 8
+    # Ignore a truncated trailing UUID
+    value = value[: len(value) - len(value) % uuid_size]
+    match uuid_length:
+        case 16:
+            return [_get_full_uuid_from_short(uuid) for (uuid,) in _UINT16.iter_unpack(value)]
+        case 32:
+            return [_get_full_uuid_from_short(uuid) for (uuid,) in _UINT32.iter_unpack(value)]
+        case _:
+            return [_uuid_from_int((high << 64) | low) for low, high in _UINT128.iter_unpack(value)]
+
+
+@lru_cache(maxsize=512)
+def _b64encode(data: bytes) -> str:
+    # Advertisers repeat the same payloads, so reuse their encoded form
+    return base64.b64encode(data).decode("ascii")
+
+
+# A str is base64 text, the form data is serialized to, so dumps validate back; it is the
+# only form accepted from JSON
+_BASE64_STR_SCHEMA: Final[core_schema.CoreSchema] = core_schema.no_info_after_validator_function(
+    base64.b64decode, core_schema.str_schema(strict=True)
+)
+
+# From Python, bytes is taken as is and other buffers are copied. All of it is checked in
+# pydantic-core, so bytes input from the decoders runs no Python validator, and every branch
+# is strict so text that is not base64 is rejected rather than encoded as UTF-8.
+_BYTES_OR_BASE64_SCHEMA: Final[core_schema.CoreSchema] = core_schema.json_or_python_schema(
+    json_schema=_BASE64_STR_SCHEMA,
+    python_schema=core_schema.union_schema(
+        [
+            _BASE64_STR_SCHEMA,
+            core_schema.bytes_schema(strict=True),
+            core_schema.no_info_after_validator_function(
+                bytes, core_schema.is_instance_schema((bytearray, memoryview))
+            ),
+        ],
+        mode="left_to_right",
+    ),
+)
+
+_BytesOrBase64 = Annotated[
+    bytes, GetPydanticSchema(lambda _source, _handler: _BYTES_OR_BASE64_SCHEMA)
+]
 
 
 class ServiceData(BaseModel):
-    uuid: str
-    data: bytes
+    uuid: UUID
+    data: _BytesOrBase64
+
+    @field_serializer("uuid")
+    def serialize_uuid(self, uuid: UUID) -> str:
+        return str(uuid)
 
     @field_serializer("data")
     def serialize_data(self, data: bytes) -> str:
-        return base64.b64encode(data).decode("utf-8")
-
-    @field_validator("data", mode="before")
-    def validate_data(cls, data: bytes | str) -> bytes:
-        if isinstance(data, str):
-            return base64.b64decode(data)
-        return data
+        return _b64encode(data)
 
 
 def decode_service_data(
@@ -149,19 +261,29 @@ def decode_service_data(
     ],
     value: bytes,
 ) -> ServiceData:
-    uuid_length = {
-        AdType.SERVICE_DATA_16_BIT_UUID: 16,
-        AdType.SERVICE_DATA_32_BIT_UUID: 32,
-        AdType.SERVICE_DATA_128_BIT_UUID: 128,
-    }[ad_type]
-    uuid = get_full_uuid(int.from_bytes(value[: uuid_length // 8], "little"), uuid_length)
-    data = value[uuid_length // 8 :]
-    return ServiceData(uuid=str(uuid), data=data)
+    uuid_length = _UUID_BIT_LENGTHS[ad_type]
+    if not uuid_length:
+        raise ValueError(f"AD type {ad_type:#04x} does not carry UUIDs.")
+    uuid_size = uuid_length // 8
+    if len(value) < uuid_size:
+        # A truncated UUID is read from whatever bytes are present
+        uuid_int = int.from_bytes(value, "little")
+    elif uuid_length == 128:
+        low, high = _UINT128.unpack_from(value)
+        uuid_int = (high << 64) | low
+    else:
+        (uuid_int,) = (_UINT16 if uuid_length == 16 else _UINT32).unpack_from(value)
+    if uuid_length == 128:
+        uuid = _uuid_from_int(uuid_int)
+    else:
+        uuid = _get_full_uuid_from_short(uuid_int)
+    data = value[uuid_size:]
+    return ServiceData(uuid=uuid, data=data)
 
 
 class ManufacturerData(BaseModel):
     company_identifier: int
-    data: bytes
+    data: _BytesOrBase64
 
     @computed_field
     def company_name(self) -> str | None:
@@ -169,68 +291,117 @@ class ManufacturerData(BaseModel):
 
     @field_serializer("data")
     def serialize_data(self, data: bytes) -> str:
-        return base64.b64encode(data).decode("utf-8")
-
-    @field_validator("data", mode="before")
-    def validate_data(cls, data: bytes | str) -> bytes:
-        if isinstance(data, str):
-            return base64.b64decode(data)
-        return data
+        return _b64encode(data)
 
     def __bytes__(self) -> bytes:
         return self.company_identifier.to_bytes(2, "little") + self.data
 
 
+def _decode_company_identifier(value: bytes) -> int:
+    if len(value) < 2:
+        # A truncated company identifier is read from whatever bytes are present
+        return int.from_bytes(value, "little")
+    return _UINT16.unpack_from(value)[0]
+
+
 def decode_manufacturer_data(value: bytes) -> ManufacturerData:
-    company_identifier = int.from_bytes(value[:2], "little")
+    company_identifier = _decode_company_identifier(value)
     data = value[2:]
     return ManufacturerData(company_identifier=company_identifier, data=data)
 
 
 def decode_str(value: bytes) -> str:
-    return value.strip(b"\x00").decode("utf-8")
-
-
-type DecodedAdValue = Flags | list[str] | ServiceData | ManufacturerData | str
-
-
-def decode_ad_struct(ad_type: AdType | int, value: bytes) -> DecodedAdValue | None:
-    if ad_type not in AdType:
-        return None
-    ad_type = AdType(ad_type)
-    match ad_type:
-        case AdType.FLAGS:
-            return decode_flags(value)
-        case (
-            AdType.INCOMPLETE_LIST_OF_16_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS
-            | AdType.COMPLETE_LIST_OF_16_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS
-            | AdType.INCOMPLETE_LIST_OF_32_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS
-            | AdType.COMPLETE_LIST_OF_32_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS
-            | AdType.INCOMPLETE_LIST_OF_128_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS
-            | AdType.COMPLETE_LIST_OF_128_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS
-            | AdType.LIST_OF_16_BIT_SERVICE_SOLICITATION_UUIDS
-            | AdType.LIST_OF_32_BIT_SERVICE_SOLICITATION_UUIDS
-            | AdType.LIST_OF_128_BIT_SERVICE_SOLICITATION_UUIDS
-        ):
-            return decode_uuid_list(ad_type, value)
-        case (
-            AdType.SERVICE_DATA_16_BIT_UUID
-            | AdType.SERVICE_DATA_32_BIT_UUID
-            | AdType.SERVICE_DATA_128_BIT_UUID
-        ):
-            return decode_service_data(ad_type, value)
-        case AdType.MANUFACTURER_SPECIFIC_DATA:
-            return decode_manufacturer_data(value)
-        case AdType.SHORTENED_LOCAL_NAME | AdType.COMPLETE_LOCAL_NAME | AdType.URI:
-            return decode_str(value)
-        case _:
-            return None
+    # The default codec is UTF-8; leaving it implicit skips the codec name lookup
+    return value.strip(b"\x00").decode()
+
+
+type DecodedAdValue = Flags | list[UUID] | ServiceData | ManufacturerData | str
+
+
+_DECODERS: Final[dict[int, Callable[[bytes], DecodedAdValue]]] = {
+    AdType.FLAGS: decode_flags,
+    **{ad_type: partial(decode_uuid_list, ad_type) for ad_type in _UUID_LIST_AD_TYPES},
+    **{ad_type: partial(decode_service_data, ad_type) for ad_type in _SERVICE_DATA_AD_TYPES},
+    AdType.MANUFACTURER_SPECIFIC_DATA: decode_manufacturer_data,
+    AdType.SHORTENED_LOCAL_NAME: decode_str,
+    AdType.COMPLETE_LOCAL_NAME: decode_str,
+    AdType.URI: decode_str,
+}
+
+
+def decode_ad_struct(ad_type: int, value: bytes) -> DecodedAdValue | None:
+    decoder = _DECODERS.get(ad_type)
+    return decoder(value) if decoder else None
+
+
+@dataclass(frozen=True)
+class AdStruct:
+    # _decoded is a cache slot rather than a field; it stays unset until decoded is read
+    __slots__ = ("length", "ad_type", "value", "_decoded")
+
+    length: int
+    ad_type: int
+    # Annotated so dicts validated into an AdPacket accept base64 text for value
+    value: _BytesOrBase64
+
+    @property
+    def decoded(self) -> DecodedAdValue | None:
+        try:
+            return self._decoded
+        except AttributeError:
+            decoded = decode_ad_struct(self.ad_type, self.value)
+            object.__setattr__(self, "_decoded", decoded)
+            return decoded
+
+    @property
+    def ad_type_enum(self) -> AdType | None:
+        return _AD_TYPES.get(self.ad_type)
+
+    @property
+    def ad_type_name(self) -> str | None:
+        return _AD_TYPE_NAMES.get(self.ad_type)
+
+    def __bytes__(self) -> bytes:
+        try:
+            return _AD_HEADER.pack(self.length, self.ad_type) + self.value
+        except struct.error as e:
+            raise ValueError("bytes must be in range(0, 256)") from e
+
+    def __reduce__(self) -> tuple[type["AdStruct"], tuple[int, int, bytes]]:
+        # Rebuild through __init__; the frozen dataclass cannot restore slot state by setattr
+        return AdStruct, (self.length, self.ad_type, self.value)
+
+    def to_model(self) -> "AdStructModel":
+        return AdStructModel(length=self.length, ad_type=self.ad_type, value=self.value)
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        return self.to_model().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        return self.to_model().model_dump_json(**kwargs)
+
+    @classmethod
+    def model_validate(cls, obj: Any) -> "AdStruct":
+        return AdStructModel.model_validate(obj).to_ad_struct()
+
+    @classmethod
+    def model_validate_json(cls, json_data: str | bytes) -> "AdStruct":
+        return AdStructModel.model_validate_json(json_data).to_ad_struct()
+
 
+def _serialize_decoded(decoded: DecodedAdValue | None) -> Any:
+    # UUID lists are kept as UUID objects in memory but serialized as strings
+    if isinstance(decoded, list):
+        return [str(uuid) for uuid in decoded]
+    return decoded
+
+
+class AdStructModel(BaseModel):
+    """Pydantic form of AdStruct, built only when an AD structure is validated or serialized."""
 
-class AdStruct(BaseModel):
     length: int
-    ad_type: AdType | int
-    value: bytes
+    ad_type: int
+    value: _BytesOrBase64
 
     @computed_field
     def decoded(self) -> DecodedAdValue | None:
@@ -238,91 +409,127 @@ class AdStruct(BaseModel):
 
     @computed_field
     def ad_type_name(self) -> str | None:
-        try:
-            return AdType(self.ad_type).name
-        except ValueError:
-            return None
+        return _AD_TYPE_NAMES.get(self.ad_type)
 
     @field_serializer("value")
     def serialize_value(self, value: bytes) -> str:
-        return base64.b64encode(value).decode("utf-8")
+        return base64.b64encode(value).decode("ascii")
 
-    @field_validator("value", mode="before")
-    def validate_value(cls, value: bytes | str) -> bytes:
-        if isinstance(value, str):
-            return base64.b64decode(value)
-        return value
+    @field_serializer("decoded")
+    def serialize_decoded(self, decoded: DecodedAdValue | None) -> Any:
+        return _serialize_decoded(decoded)
 
-    def __bytes__(self) -> bytes:
-        return bytes([self.length, self.ad_type]) + self.value
+    def to_ad_struct(self) -> AdStruct:
+        return AdStruct(self.length, self.ad_type, self.value)
 
 
 class AdPacket(BaseModel):
-    ad_structs: list[AdStruct]
+    # Frozen, with a tuple of immutable AdStructs, so the cached properties cannot be
+    # invalidated in place; model_copy clears them
+    model_config = ConfigDict(frozen=True)
+
+    ad_structs: tuple[AdStruct, ...]
+
+    # Values derived from ad_structs and cached in the instance dict
+    _DERIVED: ClassVar[tuple[str, ...]] = ("_by_type", "uuids", "manufacturer_id", "name")
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        if update and "ad_structs" in update:
+            # model_copy does not validate, so keep a replacement immutable here
+            update = {**update, "ad_structs": tuple(update["ad_structs"])}
+        copied = super().model_copy(update=update, deep=deep)
+        # The update may replace ad_structs, so recompute derived values on the copy
+        for name in self._DERIVED:
+            vars(copied).pop(name, None)
+        return copied
+
+    @cached_property
+    def _by_type(self) -> dict[int, list[AdStruct]]:
+        # Built on first lookup and stored in the instance dict, so later reads skip
+        # pydantic's private attribute handling
+        by_type: dict[int, list[AdStruct]] = {}
+        for ad_struct in self.ad_structs:
+            by_type.setdefault(ad_struct.ad_type, []).append(ad_struct)
+        return by_type
+
+    @field_serializer("ad_structs")
+    def serialize_ad_structs(self, ad_structs: tuple[AdStruct, ...]) -> list[dict[str, Any]]:
+        return [
+            {
+                "length": ad_struct.length,
+                "ad_type": ad_struct.ad_type,
+                "value": base64.b64encode(ad_struct.value).decode("ascii"),
+                "decoded": _serialize_decoded(ad_struct.decoded),
+                "ad_type_name": ad_struct.ad_type_name,
+            }
+            for ad_struct in ad_structs
+        ]
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> "AdPacket":
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> "AdPacket":
         ad_structs: list[AdStruct] = []
-        i = 0
-        while i < len(data):
+        # AdStruct.value must be bytes, so slice bytes directly rather than through a memoryview
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        i, n = 0, len(data)
+        while i < n:
             length = data[i]
-            if length == 0:
+            end = i + length + 1
+            if length == 0 or end > n:
                 break
-            if i + length + 1 > len(data):
-                break
-            ad_type = data[i + 1]
-            value = data[i + 2 : i + length + 1]
-            ad_structs.append(AdStruct(length=length, ad_type=ad_type, value=value))
-            i += length + 1
-        return cls(ad_structs=ad_structs)
+            ad_structs.append(AdStruct(length, data[i + 1], data[i + 2 : end]))
+            i = end
+        return cls(ad_structs=tuple(ad_structs))
 
-    @property
+    @cached_property
     def uuids(self) -> list[UUID]:
-        uuids: list[UUID] = []
-        for ad_type in (
-            AdType.INCOMPLETE_LIST_OF_16_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS,
-            AdType.COMPLETE_LIST_OF_16_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS,
-            AdType.INCOMPLETE_LIST_OF_32_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS,
-            AdType.COMPLETE_LIST_OF_32_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS,
-            AdType.INCOMPLETE_LIST_OF_128_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS,
-            AdType.COMPLETE_LIST_OF_128_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS,
-            AdType.LIST_OF_16_BIT_SERVICE_SOLICITATION_UUIDS,
-            AdType.LIST_OF_32_BIT_SERVICE_SOLICITATION_UUIDS,
-            AdType.LIST_OF_128_BIT_SERVICE_SOLICITATION_UUIDS,
-        ):
-            for ad_struct in self.get_all(ad_type):
-                uuids.extend([UUID(s) for s in cast(list[str], ad_struct.decoded)])
-        for ad_type in (
-            AdType.SERVICE_DATA_16_BIT_UUID,
-            AdType.SERVICE_DATA_32_BIT_UUID,
-            AdType.SERVICE_DATA_128_BIT_UUID,
-        ):
-            for ad_struct in self.get_all(ad_type):
-                uuids.append(UUID(cast(ServiceData, ad_struct.decoded).uuid))
+        # Walk the type index directly; get_all would copy a list for every type probed
+        by_type = self._by_type
+        uuids = [
+            uuid
+            for ad_type in _UUID_LIST_AD_TYPES
+            for ad_struct in by_type.get(ad_type, ())
+            for uuid in cast(list[UUID], ad_struct.decoded)
+        ]
+        uuids += [
+            cast(ServiceData, ad_struct.decoded).uuid
+            for ad_type in _SERVICE_DATA_AD_TYPES
+            for ad_struct in by_type.get(ad_type, ())
+        ]
         return uuids
 
-    @property
+    @cached_property
     def manufacturer_id(self) -> int | None:
         manufacturer_data_struct = self.get(AdType.MANUFACTURER_SPECIFIC_DATA)
         if not manufacturer_data_struct:
             return None
-        return cast(ManufacturerData, manufacturer_data_struct.decoded).company_identifier
+        # Only the identifier is needed, so skip building the full ManufacturerData
+        return _decode_company_identifier(manufacturer_data_struct.value)
 
-    @property
+    @cached_property
     def name(self) -> str | None:
         name_struct = self.get(AdType.COMPLETE_LOCAL_NAME) or self.get(AdType.SHORTENED_LOCAL_NAME)
         if not name_struct:
             return None
         return cast(str, name_struct.decoded)
 
-    def get(self, ad_type: AdType) -> AdStruct | None:
-        for ad_struct in self.ad_structs:
-            if ad_struct.ad_type == ad_type:
-                return ad_struct
-        return None
+    def get(self, ad_type: int) -> AdStruct | None:
+        ad_structs = self._by_type.get(ad_type)
+        return ad_structs[0] if ad_structs else None
 
-    def get_all(self, ad_type: AdType) -> list[AdStruct]:
-        return [ad_struct for ad_struct in self.ad_structs if ad_struct.ad_type == ad_type]
+    def get_all(self, ad_type: int) -> list[AdStruct]:
+        return list(self._by_type.get(ad_type, ()))
 
     def __bytes__(self) -> bytes:
-        return b"".join(bytes(ad_struct) for ad_struct in self.ad_structs)
+        # Join headers and values directly rather than concatenating each AdStruct first
+        pack_header = _AD_HEADER.pack
+        try:
+            return b"".join(
+                [
+                    part
+                    for ad_struct in self.ad_structs
+                    for part in (pack_header(ad_struct.length, ad_struct.ad_type), ad_struct.value)
+                ]
+            )
+        except struct.error as e:
+            raise ValueError("bytes must be in range(0, 256)") from e
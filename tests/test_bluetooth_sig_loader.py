@@ -0,0 +1,138 @@
+import pickle
+import subprocess
+from uuid import UUID
+
+import pytest
+
+import bluenumbers
+from bluenumbers import bluetooth_sig_loader
+from bluenumbers.bluetooth_sig_loader import YAML_CACHE_SUFFIX, _load_yaml_cached, get_full_uuid
+
+
+class TestGetFullUUID:
+    def test_short_uuid_replaces_first_32_bits(self):
+        assert get_full_uuid(0x180F) == UUID("0000180f-0000-1000-8000-00805f9b34fb")
+        assert get_full_uuid(0x0001) == UUID("00000001-0000-1000-8000-00805f9b34fb")
+
+
+class TestLoadYamlCached:
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setenv("BLUENUMBERS_CACHE_DIR", str(cache_dir))
+        return cache_dir
+
+    @pytest.fixture
+    def yaml_file(self, tmp_path):
+        yaml_file = tmp_path / "data" / "values.yaml"
+        yaml_file.parent.mkdir()
+        yaml_file.write_text("values:\n  - value: 1\n    name: One\n")
+        return yaml_file
+
+    def test_miss_writes_cache(self, cache_dir, yaml_file):
+        assert _load_yaml_cached(yaml_file) == {"values": [{"value": 1, "name": "One"}]}
+        assert (cache_dir / ("values.yaml" + YAML_CACHE_SUFFIX)).exists()
+        # The cache is kept out of the directory holding the YAML files
+        assert list(yaml_file.parent.iterdir()) == [yaml_file]
+
+    def test_hit_skips_parsing(self, cache_dir, yaml_file, monkeypatch):
+        expected = _load_yaml_cached(yaml_file)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML parsed despite a valid cache")
+
+        monkeypatch.setattr(bluetooth_sig_loader.yaml, "load", fail)
+        assert _load_yaml_cached(yaml_file) == expected
+
+    def test_changed_yaml_invalidates_cache(self, cache_dir, yaml_file):
+        _load_yaml_cached(yaml_file)
+        yaml_file.write_text("values:\n  - value: 2\n    name: Two\n")
+        assert _load_yaml_cached(yaml_file) == {"values": [{"value": 2, "name": "Two"}]}
+
+    @pytest.mark.parametrize("payload", [b"\x80", b"cbuiltins\nnope\n."])
+    def test_corrupt_cache_falls_back_to_parsing(self, cache_dir, yaml_file, payload):
+        expected = _load_yaml_cached(yaml_file)
+        cache_file = cache_dir / ("values.yaml" + YAML_CACHE_SUFFIX)
+        digest = cache_file.read_bytes()[:16]
+        cache_file.write_bytes(digest + payload)
+
+        assert _load_yaml_cached(yaml_file) == expected
+        # The broken cache is replaced with a readable one
+        assert pickle.loads(cache_file.read_bytes()[16:]) == expected
+
+
+class TestLazyTables:
+    @pytest.fixture(autouse=True)
+    def tables(self, monkeypatch):
+        tables = {}
+        monkeypatch.setattr(bluetooth_sig_loader, "_tables", tables)
+        return tables
+
+    @pytest.fixture
+    def loads(self, monkeypatch):
+        loads = []
+
+        def load_ad_types():
+            loads.append("ad_types")
+            return {0x01: {"value": 0x01, "name": "Flags"}}
+
+        monkeypatch.setitem(bluetooth_sig_loader._TABLE_LOADERS, "ad_types", load_ad_types)
+        return loads
+
+    def test_loaded_once_on_first_access(self, loads):
+        assert loads == []
+        first = bluetooth_sig_loader.ad_types
+        assert bluetooth_sig_loader.ad_types is first
+        assert loads == ["ad_types"]
+
+    def test_package_attribute_returns_loaded_table(self, loads):
+        assert bluenumbers.ad_types == {0x01: {"value": 0x01, "name": "Flags"}}
+        assert bluenumbers.ad_types is bluetooth_sig_loader.ad_types
+        assert loads == ["ad_types"]
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            bluetooth_sig_loader.not_a_table  # noqa: B018
+
+
+class TestUpdate:
+    @pytest.fixture
+    def git(self, tmp_path, monkeypatch):
+        """Fake git with a local HEAD, a remote HEAD and the HEAD after a reset."""
+        state = {"local": "aaa", "remote": "aaa", "fetched": "bbb"}
+        commands = []
+
+        def run(args, **kwargs):
+            command = [str(arg) for arg in args[3:]]
+            commands.append(command[0])
+            stdout = ""
+            if command[0] == "rev-parse":
+                stdout = state["local"] + "\n"
+            elif command[0] == "ls-remote":
+                stdout = f"{state['remote']}\tHEAD\n"
+            elif command[0] == "reset":
+                state["local"] = state["fetched"]
+            return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr="")
+
+        monkeypatch.setattr(bluetooth_sig_loader, "get_repo_dir", lambda: tmp_path)
+        monkeypatch.setattr(bluetooth_sig_loader.subprocess, "run", run)
+        return state, commands
+
+    def test_up_to_date_does_not_fetch(self, git, monkeypatch):
+        _, commands = git
+        tables = {"ad_types": {}}
+        monkeypatch.setattr(bluetooth_sig_loader, "_tables", tables)
+
+        assert bluetooth_sig_loader.update() is False
+        assert commands == ["rev-parse", "ls-remote"]
+        assert "ad_types" in tables
+
+    def test_new_commit_clears_tables(self, git, monkeypatch):
+        state, commands = git
+        state["remote"] = "bbb"
+        tables = {"ad_types": {}}
+        monkeypatch.setattr(bluetooth_sig_loader, "_tables", tables)
+
+        assert bluetooth_sig_loader.update() is True
+        assert commands == ["rev-parse", "ls-remote", "fetch", "reset", "rev-parse"]
+        assert tables == {}
@@ -1,4 +1,7 @@
 import base64
+import copy
+import json
+import pickle
 from uuid import UUID
 
 import pytest
@@ -38,6 +41,17 @@ class TestGetFullUUID:
         with pytest.raises(ValueError, match="Invalid bit length. Must be 16, 32, or 128."):
             get_full_uuid(0xAAAA, 64)
 
+    def test_out_of_range_uuid(self):
+        for short_uuid, bit_length in (
+            (-1, 16),
+            (0x10000, 16),
+            (2**40, 32),
+            (-1, 128),
+            (2**128, 128),
+        ):
+            with pytest.raises(ValueError):
+                get_full_uuid(short_uuid, bit_length)
+
 
 class TestDecodeFlags:
     def test_decode_flags(self):
@@ -58,6 +72,9 @@ class TestDecodeFlags:
         # Test with no flags
         assert decode_flags(bytes([0])) == Flags(0)
 
+        # Test with an empty value
+        assert decode_flags(b"") == Flags(0)
+
 
 class TestDecodeUUIDList:
     def test_decode_16bit_uuid_list(self):
@@ -67,8 +84,8 @@ class TestDecodeUUIDList:
             AdType.COMPLETE_LIST_OF_16_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS, value
         )
         assert len(uuids) == 2
-        assert uuids[0] == str(UUID("0000bbaa-0000-1000-8000-00805f9b34fb"))
-        assert uuids[1] == str(UUID("0000ddcc-0000-1000-8000-00805f9b34fb"))
+        assert uuids[0] == UUID("0000bbaa-0000-1000-8000-00805f9b34fb")
+        assert uuids[1] == UUID("0000ddcc-0000-1000-8000-00805f9b34fb")
 
     def test_decode_32bit_uuid_list(self):
         # One 32-bit UUID (4 bytes)
@@ -77,7 +94,7 @@ class TestDecodeUUIDList:
             AdType.COMPLETE_LIST_OF_32_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS, value
         )
         assert len(uuids) == 1
-        assert uuids[0] == str(UUID("ddccbbaa-0000-1000-8000-00805f9b34fb"))
+        assert uuids[0] == UUID("ddccbbaa-0000-1000-8000-00805f9b34fb")
 
     def test_decode_128bit_uuid_list(self):
         # One 128-bit UUID (16 bytes)
@@ -88,7 +105,31 @@ class TestDecodeUUIDList:
         assert len(uuids) == 1
         # The bytes are interpreted in little-endian order
         expected_uuid = UUID("0f0e0d0c-0b0a-0908-0706-050403020100")
-        assert uuids[0] == str(expected_uuid)
+        assert uuids[0] == expected_uuid
+
+    def test_decoded_uuid_behaves_like_uuid(self):
+        value = bytes(range(16))
+        (uuid,) = decode_uuid_list(
+            AdType.COMPLETE_LIST_OF_128_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS, value
+        )
+        expected_uuid = UUID("0f0e0d0c-0b0a-0908-0706-050403020100")
+        assert hash(uuid) == hash(expected_uuid)
+        assert str(uuid) == str(expected_uuid)
+        assert pickle.loads(pickle.dumps(uuid)) == expected_uuid
+
+    def test_decode_non_uuid_ad_type(self):
+        with pytest.raises(ValueError):
+            decode_uuid_list(AdType.FLAGS, bytes([0xAA, 0xBB]))  # type: ignore[arg-type]
+        with pytest.raises(ValueError):
+            decode_service_data(AdType.FLAGS, bytes([0x01, 0x02, 0x03, 0x04, 0x05]))  # type: ignore[arg-type]
+
+    def test_decode_truncated_uuid_list(self):
+        # One 16-bit UUID followed by a dangling byte
+        value = bytes([0xAA, 0xBB, 0xCC])
+        uuids = decode_uuid_list(
+            AdType.COMPLETE_LIST_OF_16_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS, value
+        )
+        assert uuids == [UUID("0000bbaa-0000-1000-8000-00805f9b34fb")]
 
 
 class TestDecodeStr:
@@ -111,7 +152,7 @@ class TestDecodeServiceData:
         value = uuid_bytes + data_bytes
 
         service_data = decode_service_data(AdType.SERVICE_DATA_16_BIT_UUID, value)
-        assert service_data.uuid == str(UUID("0000bbaa-0000-1000-8000-00805f9b34fb"))
+        assert service_data.uuid == UUID("0000bbaa-0000-1000-8000-00805f9b34fb")
         assert service_data.data == data_bytes
 
     def test_decode_32bit_service_data(self):
@@ -121,7 +162,7 @@ class TestDecodeServiceData:
         value = uuid_bytes + data_bytes
 
         service_data = decode_service_data(AdType.SERVICE_DATA_32_BIT_UUID, value)
-        assert service_data.uuid == str(UUID("ddccbbaa-0000-1000-8000-00805f9b34fb"))
+        assert service_data.uuid == UUID("ddccbbaa-0000-1000-8000-00805f9b34fb")
         assert service_data.data == data_bytes
 
     def test_decode_128bit_service_data(self):
@@ -132,7 +173,7 @@ class TestDecodeServiceData:
 
         service_data = decode_service_data(AdType.SERVICE_DATA_128_BIT_UUID, value)
         expected_uuid = UUID("0f0e0d0c-0b0a-0908-0706-050403020100")
-        assert service_data.uuid == str(expected_uuid)
+        assert service_data.uuid == expected_uuid
         assert service_data.data == data_bytes
 
 
@@ -159,14 +200,14 @@ class TestDecodeAdStruct:
         )
         assert isinstance(result, list)
         assert len(result) == 1
-        assert result[0] == str(UUID("0000bbaa-0000-1000-8000-00805f9b34fb"))
+        assert result[0] == UUID("0000bbaa-0000-1000-8000-00805f9b34fb")
 
     def test_decode_service_data(self):
         result = decode_ad_struct(
             AdType.SERVICE_DATA_16_BIT_UUID, bytes([0xAA, 0xBB, 0x01, 0x02, 0x03])
         )
         assert isinstance(result, ServiceData)
-        assert result.uuid == str(UUID("0000bbaa-0000-1000-8000-00805f9b34fb"))
+        assert result.uuid == UUID("0000bbaa-0000-1000-8000-00805f9b34fb")
         assert result.data == bytes([0x01, 0x02, 0x03])
 
     def test_decode_manufacturer_data(self):
@@ -181,6 +222,13 @@ class TestDecodeAdStruct:
         result = decode_ad_struct(AdType.COMPLETE_LOCAL_NAME, b"Test Device")
         assert result == "Test Device"
 
+        result = decode_ad_struct(AdType.SHORTENED_LOCAL_NAME, b"Test")
+        assert result == "Test"
+
+    def test_decode_plain_int_type(self):
+        result = decode_ad_struct(int(AdType.FLAGS), bytes([0x07]))
+        assert result == Flags(0x07)
+
     def test_decode_unknown_type(self):
         result = decode_ad_struct(999, bytes([0x01, 0x02, 0x03]))
         assert result is None
@@ -197,6 +245,46 @@ class TestAdStruct:
         ad_struct = AdStruct(length=5, ad_type=AdType.FLAGS, value=bytes([0x07]))
         assert ad_struct.decoded == Flags(0x07)
 
+    def test_decoded_is_cached(self):
+        ad_struct = AdStruct(
+            length=6, ad_type=AdType.MANUFACTURER_SPECIFIC_DATA, value=bytes([0x4C, 0x00, 0x01])
+        )
+        assert isinstance(ad_struct.decoded, ManufacturerData)
+        assert ad_struct.decoded is ad_struct.decoded
+
+    def test_model_adapter(self):
+        ad_struct = AdStruct(length=3, ad_type=AdType.SHORTENED_LOCAL_NAME, value=b"AB")
+        serialized = ad_struct.model_dump()
+        assert serialized == {
+            "length": 3,
+            "ad_type": AdType.SHORTENED_LOCAL_NAME,
+            "value": base64.b64encode(b"AB").decode("utf-8"),
+            "decoded": "AB",
+            "ad_type_name": "SHORTENED_LOCAL_NAME",
+        }
+        assert ad_struct.to_model().to_ad_struct() == ad_struct
+        assert AdStruct.model_validate(serialized) == ad_struct
+        assert AdStruct.model_validate_json(ad_struct.model_dump_json()) == ad_struct
+
+        # The base64 value is decoded when validating
+        restored = AdStruct.model_validate({"length": 2, "ad_type": AdType.FLAGS, "value": "Bg=="})
+        assert bytes(restored) == bytes([0x02, AdType.FLAGS, 0x06])
+
+    def test_bytes_out_of_range(self):
+        with pytest.raises(ValueError):
+            bytes(AdStruct(length=256, ad_type=AdType.FLAGS, value=b"\x06"))
+        with pytest.raises(ValueError):
+            bytes(AdPacket(ad_structs=(AdStruct(length=2, ad_type=-1, value=b"\x06"),)))
+
+    def test_copy_and_pickle(self):
+        ad_struct = AdStruct(length=2, ad_type=AdType.FLAGS, value=bytes([0x07]))
+        assert ad_struct.decoded == Flags(0x07)
+
+        assert copy.deepcopy(ad_struct) == ad_struct
+        restored = pickle.loads(pickle.dumps(ad_struct))
+        assert restored == ad_struct
+        assert restored.decoded == Flags(0x07)
+
     def test_ad_type_name(self):
         ad_struct = AdStruct(length=5, ad_type=AdType.FLAGS, value=bytes([0x07]))
         assert ad_struct.ad_type_name == "FLAGS"
@@ -208,6 +296,13 @@ class TestAdStruct:
         )
         assert ad_struct.ad_type_name is None
 
+    def test_ad_type_enum(self):
+        ad_struct = AdStruct(length=2, ad_type=0x01, value=bytes([0x07]))
+        assert ad_struct.ad_type_enum is AdType.FLAGS
+
+        ad_struct = AdStruct(length=2, ad_type=0xEE, value=bytes([0x07]))
+        assert ad_struct.ad_type_enum is None
+
     def test_bytes_conversion(self):
         """Test that converting an AdStruct to bytes works correctly."""
         # Create an AdStruct with the correct length
@@ -271,7 +366,17 @@ class TestAdPacket:
             == AdType.COMPLETE_LIST_OF_16_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS
         )
         assert packet.ad_structs[2].value == bytes([0xAA, 0xBB])
-        assert packet.ad_structs[2].decoded == [str(UUID("0000bbaa-0000-1000-8000-00805f9b34fb"))]
+        assert packet.ad_structs[2].decoded == [UUID("0000bbaa-0000-1000-8000-00805f9b34fb")]
+
+    def test_from_buffer(self):
+        data = bytes([0x02, AdType.FLAGS, 0x06, 0x03, AdType.COMPLETE_LOCAL_NAME, *b"AB"])
+
+        for buffer in (bytearray(data), memoryview(data)):
+            packet = AdPacket.from_bytes(buffer)
+            assert len(packet.ad_structs) == 2
+            assert type(packet.ad_structs[1].value) is bytes
+            assert packet.ad_structs[1].value == b"AB"
+            assert bytes(packet) == data
 
     def test_uuids_property(self):
         # Create a sample advertisement packet with various UUID types
@@ -461,39 +566,145 @@ class TestAdPacket:
         # Check if the conversion is correct
         assert converted_data == original_data
 
+    def test_immutable(self):
+        packet = AdPacket.from_bytes(bytes([0x03, AdType.COMPLETE_LOCAL_NAME, *b"AB"]))
+        assert packet.name == "AB"
+        assert packet.uuids is packet.uuids
+
+        with pytest.raises(ValueError):
+            packet.ad_structs = ()  # type: ignore[misc]
+
+    def test_invalid_ad_structs(self):
+        for ad_structs in (None, 5, [5]):
+            with pytest.raises(ValueError):
+                AdPacket(ad_structs=ad_structs)  # type: ignore[arg-type]
+
+    def test_model_copy_with_update(self):
+        packet = AdPacket.from_bytes(bytes([0x03, AdType.COMPLETE_LOCAL_NAME, *b"AB"]))
+        name_struct = packet.get(AdType.COMPLETE_LOCAL_NAME)
+        assert name_struct is not None
+        assert name_struct.value == b"AB"
+        assert packet.name == "AB"
+        assert packet.uuids == []
+        assert packet.manufacturer_id is None
+
+        copied = packet.model_copy(
+            update={"ad_structs": [AdStruct(3, AdType.COMPLETE_LOCAL_NAME, b"CD")]}
+        )
+        copied_name_struct = copied.get(AdType.COMPLETE_LOCAL_NAME)
+        assert copied_name_struct is not None
+        assert copied_name_struct.value == b"CD"
+        assert copied.get_all(AdType.COMPLETE_LOCAL_NAME) == list(copied.ad_structs)
+        assert isinstance(copied.ad_structs, tuple)
+        assert copied.name == "CD"
+
+        copied = packet.model_copy(
+            update={
+                "ad_structs": [
+                    AdStruct(
+                        3,
+                        AdType.COMPLETE_LIST_OF_16_BIT_SERVICE_OR_SERVICE_CLASS_UUIDS,
+                        b"\x0f\x18",
+                    ),
+                    AdStruct(3, AdType.MANUFACTURER_SPECIFIC_DATA, b"\x4c\x00"),
+                ]
+            }
+        )
+        assert copied.name is None
+        assert copied.uuids == [UUID("0000180f-0000-1000-8000-00805f9b34fb")]
+        assert copied.manufacturer_id == 0x004C
+        assert packet.get(AdType.COMPLETE_LOCAL_NAME) is name_struct
+
+    def test_serialization_round_trip(self):
+        data = bytes(
+            [
+                0x02,
+                AdType.FLAGS,
+                0x06,
+                0x05,
+                AdType.MANUFACTURER_SPECIFIC_DATA,
+                0x4C,
+                0x00,
+                0x01,
+                0x02,
+            ]
+        )
+        packet = AdPacket.from_bytes(data)
+
+        serialized = packet.model_dump()
+        assert serialized["ad_structs"][0]["value"] == base64.b64encode(bytes([0x06])).decode(
+            "utf-8"
+        )
+        assert serialized["ad_structs"][0]["ad_type_name"] == "FLAGS"
+        assert serialized["ad_structs"][1]["decoded"]["company_identifier"] == 0x004C
+
+        restored = AdPacket.model_validate_json(packet.model_dump_json())
+        assert restored == packet
+        assert bytes(restored) == data
+
 
 class TestServiceData:
     def test_creation(self):
         service_data = ServiceData(
-            uuid="0000180f-0000-1000-8000-00805f9b34fb", data=bytes([0x01, 0x02, 0x03])
+            uuid=UUID("0000180f-0000-1000-8000-00805f9b34fb"), data=bytes([0x01, 0x02, 0x03])
         )
-        assert service_data.uuid == "0000180f-0000-1000-8000-00805f9b34fb"
+        assert service_data.uuid == UUID("0000180f-0000-1000-8000-00805f9b34fb")
         assert service_data.data == bytes([0x01, 0x02, 0x03])
 
     def test_serialization(self):
         service_data = ServiceData(
-            uuid="0000180f-0000-1000-8000-00805f9b34fb", data=bytes([0x01, 0x02, 0x03])
+            uuid=UUID("0000180f-0000-1000-8000-00805f9b34fb"), data=bytes([0x01, 0x02, 0x03])
         )
         # This tests the field_serializer
         serialized = service_data.model_dump()
+        assert serialized["uuid"] == "0000180f-0000-1000-8000-00805f9b34fb"
         assert serialized["data"] == base64.b64encode(bytes([0x01, 0x02, 0x03])).decode("utf-8")
 
     def test_validation(self):
         # Test with bytes
         service_data = ServiceData(
-            uuid="0000180f-0000-1000-8000-00805f9b34fb", data=bytes([0x01, 0x02, 0x03])
+            uuid=UUID("0000180f-0000-1000-8000-00805f9b34fb"), data=bytes([0x01, 0x02, 0x03])
         )
         assert service_data.data == bytes([0x01, 0x02, 0x03])
 
+        # Test with other bytes-like buffers
+        for buffer in (bytearray([0x01, 0x02, 0x03]), memoryview(bytes([0x01, 0x02, 0x03]))):
+            service_data = ServiceData.model_validate(
+                {"uuid": UUID("0000180f-0000-1000-8000-00805f9b34fb"), "data": buffer}
+            )
+            assert service_data.data == bytes([0x01, 0x02, 0x03])
+            assert type(service_data.data) is bytes
+
         # Test with base64 string
         base64_data = base64.b64encode(bytes([0x01, 0x02, 0x03])).decode("utf-8")
-        service_data = ServiceData(uuid="0000180f-0000-1000-8000-00805f9b34fb", data=base64_data)
+        service_data = ServiceData(
+            uuid=UUID("0000180f-0000-1000-8000-00805f9b34fb"), data=base64_data
+        )
         assert service_data.data == bytes([0x01, 0x02, 0x03])
 
+        # Test with base64 JSON
+        restored = ServiceData.model_validate_json(service_data.model_dump_json())
+        assert restored == service_data
+
+        # Test with a Python-mode dump
+        restored = ServiceData.model_validate(service_data.model_dump())
+        assert restored == service_data
+
+        # Text that is not base64 is rejected rather than encoded as UTF-8
+        for text in ("abc", "hello!"):
+            with pytest.raises(ValueError):
+                ServiceData.model_validate(
+                    {"uuid": UUID("0000180f-0000-1000-8000-00805f9b34fb"), "data": text}
+                )
+            with pytest.raises(ValueError):
+                ServiceData.model_validate_json(
+                    json.dumps({"uuid": "0000180f-0000-1000-8000-00805f9b34fb", "data": text})
+                )
+
         # Test with invalid type
         with pytest.raises(ValueError):
             ServiceData(
-                uuid="0000180f-0000-1000-8000-00805f9b34fb",
+                uuid=UUID("0000180f-0000-1000-8000-00805f9b34fb"),
                 data=123,  # Invalid data type
             )
 
@@ -527,11 +738,36 @@ class TestManufacturerData:
         mfg_data = ManufacturerData(company_identifier=0x004C, data=bytes([0x01, 0x02, 0x03]))
         assert mfg_data.data == bytes([0x01, 0x02, 0x03])
 
+        # Test with other bytes-like buffers
+        for buffer in (bytearray([0x01, 0x02, 0x03]), memoryview(bytes([0x01, 0x02, 0x03]))):
+            mfg_data = ManufacturerData.model_validate(
+                {"company_identifier": 0x004C, "data": buffer}
+            )
+            assert mfg_data.data == bytes([0x01, 0x02, 0x03])
+            assert type(mfg_data.data) is bytes
+
         # Test with base64 string
         base64_data = base64.b64encode(bytes([0x01, 0x02, 0x03])).decode("utf-8")
         mfg_data = ManufacturerData(company_identifier=0x004C, data=base64_data)
         assert mfg_data.data == bytes([0x01, 0x02, 0x03])
 
+        # Test with base64 JSON
+        restored = ManufacturerData.model_validate_json(mfg_data.model_dump_json())
+        assert restored == mfg_data
+
+        # Test with a Python-mode dump
+        restored = ManufacturerData.model_validate(mfg_data.model_dump())
+        assert restored == mfg_data
+
+        # Text that is not base64 is rejected rather than encoded as UTF-8
+        for text in ("abc", "hello!"):
+            with pytest.raises(ValueError):
+                ManufacturerData.model_validate({"company_identifier": 0x004C, "data": text})
+            with pytest.raises(ValueError):
+                ManufacturerData.model_validate_json(
+                    json.dumps({"company_identifier": 0x004C, "data": text})
+                )
+
         # Test with invalid type
         with pytest.raises(ValueError):
             ManufacturerData(